@@ -480,16 +480,21 @@ class DigitalMasterMintingService {
     
     // MARK: - Helpers
     
-    private func waitForReceipt(txHash: String, maxAttempts: Int = 30) async throws -> TransactionReceipt {
+    private func waitForReceipt(txHash: String, timeout: TimeInterval = 60) async throws -> TransactionReceipt {
         let rpcURL = walletService.selectedNetwork.rpcURL
-        
-        for _ in 0..<maxAttempts {
+        let deadline = Date().addingTimeInterval(timeout)
+
+        // Poll quickly at first (most receipts land within a block or two), then back
+        // off exponentially so slow confirmations don't hammer the RPC endpoint.
+        var interval: TimeInterval = 1
+        while Date() < deadline {
             if let receipt = try await fetchReceipt(txHash: txHash, rpcURL: rpcURL) {
                 return receipt
             }
-            try await Task.sleep(nanoseconds: 2_000_000_000)  // 2 seconds
+            try await Task.sleep(nanoseconds: UInt64(interval * 1_000_000_000))
+            interval = min(interval * 2, 8)
         }
-        
+
         throw MintingError.transactionTimeout
     }
     
@@ -65,6 +65,10 @@ enum AppConfig {
     
     /// Short timeout for health checks and quick validation
     static let healthCheckTimeout: TimeInterval = 5
+
+    /// Whole-transfer ceiling for large asset downloads. Per-request timeouts above
+    /// only bound inactivity between bytes; this bounds the entire transfer.
+    static let downloadResourceTimeout: TimeInterval = 1800
     
     // MARK: - Feature Flags
     
@@ -19,6 +19,11 @@ final class AssetDownloadService {
     private let session: URLSession
     private let decoder: JSONDecoder
 
+    /// Delegate session reused for all asset downloads so TCP/TLS connections to the
+    /// asset host stay warm — one handshake per host instead of one per file.
+    private let downloadDelegate: DownloadSessionDelegate
+    private let downloadSession: URLSession
+
     /// Progress 0...1 for current download (nil when idle)
     private(set) var downloadProgress: Double?
 
@@ -28,9 +33,23 @@ final class AssetDownloadService {
     /// - Parameter session: Optional for tests (e.g. URLSession with custom URLProtocol). Production uses default.
     init(baseURL: String = AppConfig.apiBaseURL, session: URLSession? = nil) {
         self.baseURL = baseURL
-        self.session = session ?? URLSession(configuration: .default)
+        // Split timeouts: timeoutIntervalForRequest bounds inactivity between bytes,
+        // timeoutIntervalForResource bounds the whole transfer. API calls get a tight
+        // ceiling; downloads get a generous one so a slow zip can't hang forever.
+        self.session = session ?? {
+            let config = URLSessionConfiguration.default
+            config.timeoutIntervalForRequest = AppConfig.defaultTimeout
+            config.timeoutIntervalForResource = AppConfig.extendedTimeout
+            return URLSession(configuration: config)
+        }()
         self.decoder = JSONDecoder()
         self.decoder.keyDecodingStrategy = .convertFromSnakeCase
+        let downloadConfig = URLSessionConfiguration.default
+        downloadConfig.timeoutIntervalForRequest = AppConfig.defaultTimeout
+        downloadConfig.timeoutIntervalForResource = AppConfig.downloadResourceTimeout
+        let downloadDelegate = DownloadSessionDelegate()
+        self.downloadDelegate = downloadDelegate
+        self.downloadSession = URLSession(configuration: downloadConfig, delegate: downloadDelegate, delegateQueue: nil)
     }
     
 
@@ -58,6 +77,29 @@ final class AssetDownloadService {
         request.setValue(deviceId, forHTTPHeaderField: "X-Device-ID")
     }
 
+    // MARK: - Request Helpers
+
+    /// Standard GET request for the asset API: JSON accept, default timeout, device ID.
+    private func makeGETRequest(url: URL) -> URLRequest {
+        var request = URLRequest(url: url)
+        request.httpMethod = "GET"
+        request.setValue("application/json", forHTTPHeaderField: "Accept")
+        request.timeoutInterval = AppConfig.defaultTimeout
+        setDeviceIdHeader(on: &request)
+        return request
+    }
+
+    /// GET an asset API path and decode the JSON response. Shared by endpoints that
+    /// don't need bespoke diagnostics or error messaging.
+    private func fetchJSON<T: Decodable>(path: String) async throws -> T {
+        guard let url = URL(string: "\(baseURL)\(path)") else {
+            throw AssetDownloadError.invalidURL
+        }
+        let (data, response) = try await session.data(for: makeGETRequest(url: url))
+        try validateResponse(response, data: data)
+        return try decoder.decode(T.self, from: data)
+    }
+
     // MARK: - List API
 
     /// GET /api/v1/assets/drum-kits
@@ -69,11 +111,7 @@ final class AssetDownloadService {
         #if DEBUG
         print("🔵 [AssetDownload] Fetching drum kit list from: \(url.absoluteString)")
         #endif
-        var request = URLRequest(url: url)
-        request.httpMethod = "GET"
-        request.setValue("application/json", forHTTPHeaderField: "Accept")
-        request.timeoutInterval = AppConfig.defaultTimeout
-        setDeviceIdHeader(on: &request)
+        let request = makeGETRequest(url: url)
         do {
             let (data, response) = try await session.data(for: request)
             try validateResponse(response, data: data)
@@ -109,11 +147,7 @@ final class AssetDownloadService {
         guard let url = URL(string: "\(baseURL)/api/v1/assets/soundfonts") else {
             throw AssetDownloadError.invalidURL
         }
-        var request = URLRequest(url: url)
-        request.httpMethod = "GET"
-        request.setValue("application/json", forHTTPHeaderField: "Accept")
-        request.timeoutInterval = AppConfig.defaultTimeout
-        setDeviceIdHeader(on: &request)
+        let request = makeGETRequest(url: url)
         do {
             let (data, response) = try await session.data(for: request)
             try validateResponse(response, data: data)
@@ -146,11 +180,7 @@ final class AssetDownloadService {
         print("🔵 [AssetDownload] Requesting download URL for kit: '\(kitId)'")
         print("🔵 [AssetDownload] URL: \(url.absoluteString)")
         #endif
-        var request = URLRequest(url: url)
-        request.httpMethod = "GET"
-        request.setValue("application/json", forHTTPHeaderField: "Accept")
-        request.timeoutInterval = AppConfig.defaultTimeout
-        setDeviceIdHeader(on: &request)
+        let request = makeGETRequest(url: url)
         do {
             let (data, response) = try await session.data(for: request)
             if let http = response as? HTTPURLResponse {
@@ -227,33 +257,13 @@ final class AssetDownloadService {
     /// GET /api/v1/assets/soundfonts/{soundfont_id}/download-url
     func getSoundFontDownloadURL(soundfontId: String, expiresIn: Int = 3600) async throws -> DownloadURLResponse {
         lastError = nil
-        guard let url = URL(string: "\(baseURL)/api/v1/assets/soundfonts/\(soundfontId)/download-url?expires_in=\(expiresIn)") else {
-            throw AssetDownloadError.invalidURL
-        }
-        var request = URLRequest(url: url)
-        request.httpMethod = "GET"
-        request.setValue("application/json", forHTTPHeaderField: "Accept")
-        request.timeoutInterval = AppConfig.defaultTimeout
-        setDeviceIdHeader(on: &request)
-        let (data, response) = try await session.data(for: request)
-        try validateResponse(response, data: data)
-        return try decoder.decode(DownloadURLResponse.self, from: data)
+        return try await fetchJSON(path: "/api/v1/assets/soundfonts/\(soundfontId)/download-url?expires_in=\(expiresIn)")
     }
 
     /// GET /api/v1/assets/bundle/download-url (optional)
     func getBundleDownloadURL(expiresIn: Int = 3600) async throws -> DownloadURLResponse {
         lastError = nil
-        guard let url = URL(string: "\(baseURL)/api/v1/assets/bundle/download-url?expires_in=\(expiresIn)") else {
-            throw AssetDownloadError.invalidURL
-        }
-        var request = URLRequest(url: url)
-        request.httpMethod = "GET"
-        request.setValue("application/json", forHTTPHeaderField: "Accept")
-        request.timeoutInterval = AppConfig.defaultTimeout
-        setDeviceIdHeader(on: &request)
-        let (data, response) = try await session.data(for: request)
-        try validateResponse(response, data: data)
-        return try decoder.decode(DownloadURLResponse.self, from: data)
+        return try await fetchJSON(path: "/api/v1/assets/bundle/download-url?expires_in=\(expiresIn)")
     }
 
     // MARK: - Download + Install
@@ -504,27 +514,25 @@ final class AssetDownloadService {
         print("🔵 [AssetDownload] Starting download from presigned URL (full): \(url.absoluteString)")
         #endif
         
-        // Create a download delegate to track progress
-        let delegate = DownloadDelegate(progressHandler: { [weak self] percent in
-            Task { @MainActor in
-                self?.downloadProgress = percent
-                progress?(percent)
-            }
-        })
-        
-        let delegateSession = URLSession(configuration: .default, delegate: delegate, delegateQueue: nil)
-        
-        let task = delegateSession.downloadTask(with: url)
-        task.resume()
-        
-        // Wait for completion
+        let task = downloadSession.downloadTask(with: url)
+
+        // Register handlers before resuming so no delegate callback can fire unobserved
         let (tempURL, urlResponse) = try await withCheckedThrowingContinuation { continuation in
-            delegate.completion = continuation
+            downloadDelegate.register(
+                task: task,
+                progress: { [weak self] percent in
+                    Task { @MainActor in
+                        self?.downloadProgress = percent
+                        progress?(percent)
+                    }
+                },
+                completion: continuation
+            )
+            task.resume()
         }
-        
-        defer { 
+
+        defer {
             try? FileManager.default.removeItem(at: tempURL)
-            delegateSession.finishTasksAndInvalidate()
         }
         
         if let http = urlResponse as? HTTPURLResponse, http.statusCode != 200 {
@@ -677,43 +685,67 @@ final class AssetDownloadService {
     // MARK: - Cleanup
 }
 
-// MARK: - Download Delegate for Progress Tracking
+// MARK: - Download Session Delegate for Progress Tracking
+
+/// Routes URLSession delegate callbacks to per-download handlers by task identifier,
+/// allowing a single long-lived session (and its connection pool) to serve all downloads.
+private final class DownloadSessionDelegate: NSObject, URLSessionDownloadDelegate, @unchecked Sendable {
+    private let lock = NSLock()
+    private var progressHandlers: [Int: (Double) -> Void] = [:]
+    private var completions: [Int: CheckedContinuation<(URL, URLResponse), Error>] = [:]
+
+    func register(
+        task: URLSessionDownloadTask,
+        progress: @escaping (Double) -> Void,
+        completion: CheckedContinuation<(URL, URLResponse), Error>
+    ) {
+        lock.lock()
+        defer { lock.unlock() }
+        progressHandlers[task.taskIdentifier] = progress
+        completions[task.taskIdentifier] = completion
+    }
 
-private final class DownloadDelegate: NSObject, URLSessionDownloadDelegate, @unchecked Sendable {
-    let progressHandler: (Double) -> Void
-    var completion: CheckedContinuation<(URL, URLResponse), Error>?
-    
-    init(progressHandler: @escaping (Double) -> Void) {
-        self.progressHandler = progressHandler
+    /// Removes and returns the completion for a task (at most one resume per download).
+    private func takeCompletion(for taskIdentifier: Int) -> CheckedContinuation<(URL, URLResponse), Error>? {
+        lock.lock()
+        defer { lock.unlock() }
+        progressHandlers.removeValue(forKey: taskIdentifier)
+        return completions.removeValue(forKey: taskIdentifier)
     }
-    
-    
+
+    private func progressHandler(for taskIdentifier: Int) -> ((Double) -> Void)? {
+        lock.lock()
+        defer { lock.unlock() }
+        return progressHandlers[taskIdentifier]
+    }
+
     func urlSession(_ session: URLSession, downloadTask: URLSessionDownloadTask, didFinishDownloadingTo location: URL) {
+        guard let completion = takeCompletion(for: downloadTask.taskIdentifier) else { return }
         guard let response = downloadTask.response else {
-            completion?.resume(throwing: AssetDownloadError.network(NSError(domain: "AssetDownload", code: -1, userInfo: [NSLocalizedDescriptionKey: "No response"])))
+            completion.resume(throwing: AssetDownloadError.network(NSError(domain: "AssetDownload", code: -1, userInfo: [NSLocalizedDescriptionKey: "No response"])))
             return
         }
-        
+
         // CRITICAL: URLSession deletes the temp file immediately after this method returns
         // We must move it to a persistent location NOW
         let persistentTemp = FileManager.default.temporaryDirectory.appendingPathComponent(UUID().uuidString)
         do {
             try FileManager.default.moveItem(at: location, to: persistentTemp)
-            completion?.resume(returning: (persistentTemp, response))
+            completion.resume(returning: (persistentTemp, response))
         } catch {
-            completion?.resume(throwing: error)
+            completion.resume(throwing: error)
         }
     }
-    
+
     func urlSession(_ session: URLSession, downloadTask: URLSessionDownloadTask, didWriteData bytesWritten: Int64, totalBytesWritten: Int64, totalBytesExpectedToWrite: Int64) {
         guard totalBytesExpectedToWrite > 0 else { return }
         let percent = Double(totalBytesWritten) / Double(totalBytesExpectedToWrite)
-        progressHandler(percent)
+        progressHandler(for: downloadTask.taskIdentifier)?(percent)
     }
-    
+
     func urlSession(_ session: URLSession, task: URLSessionTask, didCompleteWithError error: Error?) {
         if let error = error {
-            completion?.resume(throwing: error)
+            takeCompletion(for: task.taskIdentifier)?.resume(throwing: error)
         }
     }
 }
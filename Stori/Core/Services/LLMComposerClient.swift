@@ -350,13 +350,27 @@ class LLMComposerClient {
     
     @ObservationIgnored
     private var isCheckingConnection = false
-    
+
+    /// When the last probe failed; used to throttle re-probes of an unreachable backend.
+    @ObservationIgnored
+    private var lastFailedCheck: Date?
+
+    /// Minimum time between probes after a failure. SwiftUI view lifecycle can call
+    /// checkConnection several times in quick succession; one failed probe answers
+    /// all of them for this window.
+    private static let failedCheckThrottle: TimeInterval = 10
+
     func checkConnection() async {
         // Skip if already connected or check in progress
         guard !isConnected && !isCheckingConnection else { return }
+        // Skip if an unreachable backend was probed moments ago
+        if let lastFailed = lastFailedCheck,
+           Date().timeIntervalSince(lastFailed) < Self.failedCheckThrottle {
+            return
+        }
         isCheckingConnection = true
         defer { isCheckingConnection = false }
-        
+
         do {
             let healthURL = baseURL.appendingPathComponent("api/v1/health")
             let (data, response) = try await session.data(from: healthURL)
@@ -368,12 +382,15 @@ class LLMComposerClient {
                    let status = json["status"] as? String,
                    status == "ok" {
                     isConnected = true
+                    lastFailedCheck = nil
                     return
                 }
             }
             isConnected = false
+            lastFailedCheck = Date()
         } catch {
             isConnected = false
+            lastFailedCheck = Date()
             lastError = error.localizedDescription
         }
     }
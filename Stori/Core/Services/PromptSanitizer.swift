@@ -16,6 +16,32 @@ enum PromptSanitizer {
     /// Maximum length for a single user-supplied field (e.g. specific details).
     static let maxFieldLength = 500
 
+    /// Injection patterns removed literally (case-insensitive).
+    private static let literalPatterns = [
+        "ignore previous instructions",
+        "ignore all previous",
+        "disregard the above",
+        "disregard all prior",
+        "forget everything",
+        "system:",
+        "assistant:",
+        "user:",
+        "instruction:",
+        "new instruction:",
+        "override:",
+        "```"
+    ]
+
+    /// Word-boundary injection patterns, compiled once. sanitize() runs on every prompt
+    /// preview render in the template builder, so per-call NSRegularExpression
+    /// construction is the dominant cost — compile at first use instead.
+    private static let compiledInjectionPatterns: [NSRegularExpression] = [
+        "\\bignore\\s+(?:previous|prior|all)\\s+(?:instructions?|directions?)\\b",
+        "\\bdisregard\\s+(?:the\\s+)?(?:above|previous)\\b",
+        "\\bforget\\s+everything\\b",
+        "\\bnew\\s+(?:instruction|directive|command)\\b"
+    ].compactMap { try? NSRegularExpression(pattern: $0, options: [.caseInsensitive]) }
+
     /// Sanitizes user-supplied text before inclusion in AI prompts.
     /// - Parameter input: Raw user input (e.g. from TextField).
     /// - Returns: Sanitized string safe to concatenate into prompts.
@@ -31,36 +57,16 @@ enum PromptSanitizer {
         }
 
         // Remove injection patterns (literal, case-insensitive)
-        let literalPatterns = [
-            "ignore previous instructions",
-            "ignore all previous",
-            "disregard the above",
-            "disregard all prior",
-            "forget everything",
-            "system:",
-            "assistant:",
-            "user:",
-            "instruction:",
-            "new instruction:",
-            "override:",
-            "```"
-        ]
         for pattern in literalPatterns {
             cleaned = cleaned.replacingOccurrences(of: pattern, with: "", options: .caseInsensitive)
         }
 
-        // M-1: Regex-based removal for word-boundary patterns
-        let regexPatterns = [
-            "\\bignore\\s+(?:previous|prior|all)\\s+(?:instructions?|directions?)\\b",
-            "\\bdisregard\\s+(?:the\\s+)?(?:above|previous)\\b",
-            "\\bforget\\s+everything\\b",
-            "\\bnew\\s+(?:instruction|directive|command)\\b"
-        ]
-        for pattern in regexPatterns {
-            cleaned = cleaned.replacingOccurrences(
-                of: pattern,
-                with: "",
-                options: [.regularExpression, .caseInsensitive]
+        // M-1: Regex-based removal for word-boundary patterns (precompiled)
+        for regex in compiledInjectionPatterns {
+            cleaned = regex.stringByReplacingMatches(
+                in: cleaned,
+                range: NSRange(cleaned.startIndex..., in: cleaned),
+                withTemplate: ""
             )
         }
 
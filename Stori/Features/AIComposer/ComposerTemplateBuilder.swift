@@ -162,24 +162,7 @@ struct ComposerTemplateBuilder: View {
                         .padding(.vertical, 8)
                     
                     // Generated Prompt Preview
-                    VStack(alignment: .leading, spacing: 8) {
-                        HStack {
-                            Text("Generated Prompt:")
-                                .font(.caption)
-                                .foregroundColor(.secondary)
-                            Spacer()
-                            Text("\(buildPrompt().count)/500")
-                                .font(.caption)
-                                .foregroundColor(.secondary)
-                        }
-                        
-                        Text(buildPrompt())
-                            .font(.system(size: 13))
-                            .padding(12)
-                            .frame(maxWidth: .infinity, alignment: .leading)
-                            .background(Color.purple.opacity(0.1))
-                            .cornerRadius(8)
-                    }
+                    promptPreview
                 }
                 .padding()
             }
@@ -224,7 +207,32 @@ struct ComposerTemplateBuilder: View {
     }
     
     // MARK: - Helpers
-    
+
+    /// Builds the prompt once per render; buildPrompt() runs the full sanitizer,
+    /// so evaluating it separately for the preview text and the character count
+    /// doubles that work on every state change.
+    private var promptPreview: some View {
+        let prompt = buildPrompt()
+        return VStack(alignment: .leading, spacing: 8) {
+            HStack {
+                Text("Generated Prompt:")
+                    .font(.caption)
+                    .foregroundColor(.secondary)
+                Spacer()
+                Text("\(prompt.count)/500")
+                    .font(.caption)
+                    .foregroundColor(.secondary)
+            }
+
+            Text(prompt)
+                .font(.system(size: 13))
+                .padding(12)
+                .frame(maxWidth: .infinity, alignment: .leading)
+                .background(Color.purple.opacity(0.1))
+                .cornerRadius(8)
+        }
+    }
+
     private func sectionHeader(_ title: String) -> some View {
         Text(title)
             .font(.system(size: 12, weight: .semibold))